@@ -4,16 +4,18 @@
 # LICENSE file in the root directory of this source tree.
 
 # pyre-strict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, List
 
 from fbpcp.error.pcp import PcpError
-from fbpcp.service.storage_s3 import S3StorageService
 from fbpcs.pc_pre_validation.constants import (
     BINARY_REPOSITORY,
     BINARY_PATHS,
     BINARY_FILE_VALIDATOR_NAME,
+    BINARY_FILE_VALIDATION_MAX_WORKERS,
 )
 from fbpcs.pc_pre_validation.enums import ValidationResult
+from fbpcs.pc_pre_validation.storage import get_s3_storage_service
 from fbpcs.pc_pre_validation.validation_report import ValidationReport
 from fbpcs.pc_pre_validation.validator import Validator
 
@@ -27,7 +29,9 @@ class BinaryFileValidator(Validator):
         access_key_id: Optional[str] = None,
         access_key_data: Optional[str] = None,
     ) -> None:
-        self._storage_service = S3StorageService(region, access_key_id, access_key_data)
+        self._storage_service = get_s3_storage_service(
+            region, access_key_id, access_key_data
+        )
         self._name: str = BINARY_FILE_VALIDATOR_NAME
         self._binary_repository = binary_repository
         self._binary_paths = binary_paths
@@ -36,21 +40,40 @@ class BinaryFileValidator(Validator):
     def name(self) -> str:
         return self._name
 
+    def _check_binary(self, binary_full_path: str) -> Optional[str]:
+        try:
+            if not self._storage_service.file_exists(binary_full_path):
+                return "binary does not exist"
+        except PcpError as pcp_error:
+            # s3 throws the following error when an access is denied,
+            #    An error occurred (403) when calling the HeadObject operation: Forbidden
+            if "Forbidden" in str(pcp_error):
+                return str(pcp_error)
+            else:
+                # rethrow unexpected error so validation runner will skip this validation with a WARNING message
+                raise pcp_error
+        return None
+
     def __validate__(self) -> ValidationReport:
         details: Dict[str, str] = {}
-        for path in self._binary_paths:
-            binary_full_path = f"{self._binary_repository}/{path}"
-            try:
-                if not self._storage_service.file_exists(binary_full_path):
-                    details[binary_full_path] = "binary does not exist"
-            except PcpError as pcp_error:
-                # s3 throws the following error when an access is denied,
-                #    An error occurred (403) when calling the HeadObject operation: Forbidden
-                if "Forbidden" in str(pcp_error):
-                    details[binary_full_path] = str(pcp_error)
-                else:
-                    # rethrow unexpected error so validation runner will skip this validation with a WARNING message
-                    raise pcp_error
+        binary_full_paths = [
+            f"{self._binary_repository}/{path}" for path in self._binary_paths
+        ]
+        if binary_full_paths:
+            # The existence checks are independent HEAD requests, so they run
+            # concurrently. map() yields results in order and re-raises the
+            # first unexpected error.
+            with ThreadPoolExecutor(
+                max_workers=min(
+                    len(binary_full_paths), BINARY_FILE_VALIDATION_MAX_WORKERS
+                )
+            ) as executor:
+                for binary_full_path, issue in zip(
+                    binary_full_paths,
+                    executor.map(self._check_binary, binary_full_paths),
+                ):
+                    if issue:
+                        details[binary_full_path] = issue
 
         if details:
             return ValidationReport(
@@ -13,6 +13,8 @@ INPUT_DATA_VALIDATOR_NAME = "Input Data Validator"
 BINARY_FILE_VALIDATOR_NAME = "Binary File Validator"
 
 INPUT_DATA_TMP_FILE_PATH = "/tmp"
+# 1 MiB
+INPUT_DATA_READ_BUFFER_SIZE: int = 1 << 20
 
 ID_FIELD = "id_"
 CONVERSION_VALUE_FIELD = "conversion_value"
@@ -48,6 +50,11 @@ VALIDATION_REGEXES: Dict[str, Pattern[str]] = {
 
 VALID_LINE_ENDING_REGEX: Pattern[str] = re.compile(r".*(\S|\S\n)$")
 
+# The binary checks share one boto3 client, whose connection pool holds
+# botocore's default of 10 connections. More threads than that only wait
+# for a free connection.
+BINARY_FILE_VALIDATION_MAX_WORKERS = 10
+
 BINARY_REPOSITORY = "https://one-docker-repository-prod.s3.us-west-2.amazonaws.com"
 BINARY_PATHS = [
     "data_processing/attribution_id_combiner/latest/attribution_id_combiner",
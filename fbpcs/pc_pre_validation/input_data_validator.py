@@ -19,11 +19,12 @@ Error handling:
 """
 
 import csv
+import os
 import time
-from typing import Sequence, Optional
+from typing import BinaryIO, Iterator, Optional, Pattern, Sequence
 
-from fbpcp.service.storage_s3 import S3StorageService
 from fbpcs.pc_pre_validation.constants import (
+    INPUT_DATA_READ_BUFFER_SIZE,
     INPUT_DATA_TMP_FILE_PATH,
     INPUT_DATA_VALIDATOR_NAME,
     PA_FIELDS,
@@ -35,6 +36,7 @@ from fbpcs.pc_pre_validation.enums import ValidationResult
 from fbpcs.pc_pre_validation.input_data_validation_issues import (
     InputDataValidationIssues,
 )
+from fbpcs.pc_pre_validation.storage import get_s3_storage_service
 from fbpcs.pc_pre_validation.validation_report import ValidationReport
 from fbpcs.pc_pre_validation.validator import Validator
 from fbpcs.private_computation.entity.cloud_provider import CloudProvider
@@ -55,7 +57,9 @@ class InputDataValidator(Validator):
         self._input_file_path = input_file_path
         self._local_file_path: str = self._get_local_filepath()
         self._cloud_provider = cloud_provider
-        self._storage_service = S3StorageService(region, access_key_id, access_key_data)
+        self._storage_service = get_s3_storage_service(
+            region, access_key_id, access_key_data
+        )
         self._name: str = INPUT_DATA_VALIDATOR_NAME
 
     @property
@@ -72,24 +76,32 @@ class InputDataValidator(Validator):
         validation_issues = InputDataValidationIssues()
         try:
             self._download_input_file()
-            header_row = ""
-            with open(self._local_file_path) as local_file:
-                csv_reader = csv.DictReader(local_file)
-                field_names = csv_reader.fieldnames or []
-                header_row = ",".join(field_names)
-                self._validate_header(field_names)
-
-            with open(self._local_file_path, "rb") as local_file:
+            with open(
+                self._local_file_path, "rb", buffering=INPUT_DATA_READ_BUFFER_SIZE
+            ) as local_file:
                 header_line = local_file.readline().decode("utf-8")
+                field_names = next(csv.reader([header_line]), [])
+                self._validate_header(field_names)
                 self._validate_line_ending(header_line)
 
-                while raw_line := local_file.readline():
-                    line = raw_line.decode("utf-8")
-                    self._validate_line_ending(line)
-                    csv_row_reader = csv.DictReader([header_row, line])
-                    for row in csv_row_reader:
-                        for field, value in row.items():
-                            self._validate_row(validation_issues, field, value)
+                # Look up each column's regex once instead of once per value
+                field_regexes = [
+                    (field, VALIDATION_REGEXES.get(field)) for field in field_names
+                ]
+                # A single reader consumes the remaining lines as they are read,
+                # so only the current row is held in memory.
+                csv_reader = csv.reader(self._read_lines(local_file))
+                for row in csv_reader:
+                    # The data processing binaries read the file line by line,
+                    # so a quoted field must not join lines into one row.
+                    self._validate_single_line_row(
+                        csv_reader.line_num, rows_processed_count + 1
+                    )
+                    self._validate_field_count(
+                        len(field_regexes), row, rows_processed_count + 1
+                    )
+                    for (field, regex), value in zip(field_regexes, row):
+                        self._validate_row(validation_issues, field, value, regex)
                     rows_processed_count += 1
 
         except Exception as e:
@@ -99,6 +111,8 @@ class InputDataValidator(Validator):
                 rows_processed_count,
                 validation_issues,
             )
+        finally:
+            self._remove_local_file()
 
         return self._format_validation_report(
             ValidationResult.SUCCESS,
@@ -115,6 +129,16 @@ class InputDataValidator(Validator):
                 f"Failed to download the input file. Please check the file path and its permission.\n\t{e}"
             )
 
+    def _remove_local_file(self) -> None:
+        if os.path.exists(self._local_file_path):
+            os.remove(self._local_file_path)
+
+    def _read_lines(self, local_file: BinaryIO) -> Iterator[str]:
+        while raw_line := local_file.readline():
+            line = raw_line.decode("utf-8")
+            self._validate_line_ending(line)
+            yield line
+
     def _validate_header(self, header_row: Sequence[str]) -> None:
         if not header_row:
             raise Exception("The header row was empty.")
@@ -137,12 +161,28 @@ class InputDataValidator(Validator):
                 "Detected an unexpected line ending. The only supported line ending is '\\n'"
             )
 
+    def _validate_single_line_row(self, line_num: int, row_number: int) -> None:
+        if line_num != row_number:
+            raise Exception(f"Row {row_number} spans multiple lines.")
+
+    def _validate_field_count(
+        self, expected_count: int, row: Sequence[str], row_number: int
+    ) -> None:
+        if len(row) != expected_count:
+            raise Exception(
+                f"Row {row_number} has {len(row)} fields, but the header row has {expected_count} fields."
+            )
+
     def _validate_row(
-        self, validation_issues: InputDataValidationIssues, field: str, value: str
+        self,
+        validation_issues: InputDataValidationIssues,
+        field: str,
+        value: str,
+        regex: Optional[Pattern[str]],
     ) -> None:
         if value.strip() == "":
             validation_issues.count_empty_field(field)
-        elif field in VALIDATION_REGEXES and not VALIDATION_REGEXES[field].match(value):
+        elif regex and not regex.match(value):
             validation_issues.count_format_error_field(field)
 
     def _format_validation_report(
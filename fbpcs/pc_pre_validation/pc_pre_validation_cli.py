@@ -9,31 +9,16 @@
 
 """
 CLI for running validations on the input data for private computations
-
-
-Usage:
-    pc_pre_validation_cli
-        --input-file-path=<input-file-path>
-        --cloud-provider=<cloud-provider>
-        --region=<region>
-        [--access-key-id=<access-key-id>]
-        [--access-key-data=<access-key-data>]
-        [--start-timestamp=<start-timestamp>]
-        [--end-timestamp=<end-timestamp>]
-        [--valid-threshold-override=<valid-threshold-override>]
 """
 
 
+import argparse
+import logging
+import sys
 from typing import cast
 
-from docopt import docopt
-from fbpcs.pc_pre_validation.binary_file_validator import BinaryFileValidator
 from fbpcs.pc_pre_validation.enums import ValidationResult
-from fbpcs.pc_pre_validation.input_data_validator import InputDataValidator
-from fbpcs.pc_pre_validation.validator import Validator
-from fbpcs.pc_pre_validation.validators_runner import run_validators
 from fbpcs.private_computation.entity.cloud_provider import CloudProvider
-from schema import Schema, Optional, Or, Use
 
 INPUT_FILE_PATH = "--input-file-path"
 CLOUD_PROVIDER = "--cloud-provider"
@@ -44,44 +29,58 @@ START_TIMESTAMP = "--start-timestamp"
 END_TIMESTAMP = "--end-timestamp"
 VALID_THRESHOLD_OVERRIDE = "--valid-threshold-override"
 
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+# Built once at import time rather than on every call to main().
+# Abbreviations are disabled so that every option must match exactly and
+# unknown options are rejected without a prefix search over the known ones.
+_PARSER = argparse.ArgumentParser(
+    prog="pc_pre_validation_cli", description=__doc__, allow_abbrev=False
+)
+_PARSER.add_argument(INPUT_FILE_PATH, required=True)
+_PARSER.add_argument(
+    CLOUD_PROVIDER, required=True, choices=[p.name for p in CloudProvider]
+)
+_PARSER.add_argument(REGION, required=True)
+_PARSER.add_argument(ACCESS_KEY_ID, default=None)
+_PARSER.add_argument(ACCESS_KEY_DATA, default=None)
+_PARSER.add_argument(START_TIMESTAMP, default=None)
+_PARSER.add_argument(END_TIMESTAMP, default=None)
+_PARSER.add_argument(VALID_THRESHOLD_OVERRIDE, default=None)
+
 
 def main() -> None:
-    optional_string = Or(None, str)
-    cloud_provider_from_string = Use(lambda arg: CloudProvider[arg])
-
-    s = Schema(
-        {
-            INPUT_FILE_PATH: str,
-            CLOUD_PROVIDER: cloud_provider_from_string,
-            REGION: str,
-            Optional(ACCESS_KEY_ID): optional_string,
-            Optional(ACCESS_KEY_DATA): optional_string,
-            Optional(START_TIMESTAMP): optional_string,
-            Optional(END_TIMESTAMP): optional_string,
-            Optional(VALID_THRESHOLD_OVERRIDE): optional_string,
-        }
-    )
-    arguments = s.validate(docopt(__doc__))
-    assert arguments
-    print("Parsed pc_pre_validation_cli arguments")
+    arguments = _PARSER.parse_args()
+    cloud_provider = CloudProvider[arguments.cloud_provider]
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    logger.info("Parsed pc_pre_validation_cli arguments")
+
+    # The validators pull in the storage service and its AWS SDK dependencies.
+    # Import them only once the arguments are valid, so that usage errors exit
+    # without paying that cost.
+    from fbpcs.pc_pre_validation.binary_file_validator import BinaryFileValidator
+    from fbpcs.pc_pre_validation.input_data_validator import InputDataValidator
+    from fbpcs.pc_pre_validation.validator import Validator
+    from fbpcs.pc_pre_validation.validators_runner import run_validators
 
     validators = [
         cast(
             Validator,
             InputDataValidator(
-                arguments[INPUT_FILE_PATH],
-                arguments[CLOUD_PROVIDER],
-                arguments[REGION],
-                arguments[ACCESS_KEY_ID],
-                arguments[ACCESS_KEY_DATA],
+                arguments.input_file_path,
+                cloud_provider,
+                arguments.region,
+                arguments.access_key_id,
+                arguments.access_key_data,
             ),
         ),
         cast(
             Validator,
             BinaryFileValidator(
-                region=arguments[REGION],
-                access_key_id=arguments[ACCESS_KEY_ID],
-                access_key_data=arguments[ACCESS_KEY_DATA],
+                region=arguments.region,
+                access_key_id=arguments.access_key_id,
+                access_key_data=arguments.access_key_data,
             ),
         ),
     ]
@@ -91,7 +90,7 @@ def main() -> None:
     if aggregated_result == ValidationResult.FAILED:
         raise Exception(aggregated_report)
     elif aggregated_result == ValidationResult.SUCCESS:
-        print(f"Success: {aggregated_report}")
+        logger.info(f"Success: {aggregated_report}")
     else:
         raise Exception(
             "Unknown validation result: {aggregated_result}.\n"
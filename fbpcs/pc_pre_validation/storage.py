@@ -0,0 +1,25 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-strict
+
+import functools
+from typing import Optional
+
+from fbpcp.service.storage_s3 import S3StorageService
+
+
+@functools.lru_cache(maxsize=4)
+def get_s3_storage_service(
+    region: str,
+    access_key_id: Optional[str] = None,
+    access_key_data: Optional[str] = None,
+) -> S3StorageService:
+    """Returns an S3StorageService shared by every caller with the same credentials.
+
+    Building the underlying boto3 client parses the S3 service model, so the
+    validators reuse a single instance instead of each constructing their own.
+    """
+    return S3StorageService(region, access_key_id, access_key_data)
@@ -19,7 +19,7 @@ TEST_BINARY_PATHS = ["path/to/binary/1", "path/to_binary_2", "path/to_binary_3"]
 
 
 class TestBinaryFileValidator(TestCase):
-    @patch("fbpcs.pc_pre_validation.binary_file_validator.S3StorageService")
+    @patch("fbpcs.pc_pre_validation.binary_file_validator.get_s3_storage_service")
     def test_run_validations_success(self, storage_service_mock: Mock) -> None:
         expected_report = ValidationReport(
             validation_result=ValidationResult.SUCCESS,
@@ -39,7 +39,7 @@ class TestBinaryFileValidator(TestCase):
             storage_service_mock.file_exists.call_count, len(TEST_BINARY_PATHS)
         )
 
-    @patch("fbpcs.pc_pre_validation.binary_file_validator.S3StorageService")
+    @patch("fbpcs.pc_pre_validation.binary_file_validator.get_s3_storage_service")
     def test_run_validations_binary_not_exist(self, storage_service_mock: Mock) -> None:
         expected_report = ValidationReport(
             validation_result=ValidationResult.FAILED,
@@ -50,7 +50,10 @@ class TestBinaryFileValidator(TestCase):
             },
         )
         storage_service_mock.__init__(return_value=storage_service_mock)
-        storage_service_mock.file_exists.side_effect = [False, True, True]
+        # the files are checked concurrently, so answer by path rather than call order
+        storage_service_mock.file_exists.side_effect = (
+            lambda path: path != f"{TEST_BINARY_REPO}/{TEST_BINARY_PATHS[0]}"
+        )
 
         validator = BinaryFileValidator(
             TEST_REGION, TEST_BINARY_REPO, TEST_BINARY_PATHS
@@ -62,7 +65,7 @@ class TestBinaryFileValidator(TestCase):
             storage_service_mock.file_exists.call_count, len(TEST_BINARY_PATHS)
         )
 
-    @patch("fbpcs.pc_pre_validation.binary_file_validator.S3StorageService")
+    @patch("fbpcs.pc_pre_validation.binary_file_validator.get_s3_storage_service")
     def test_run_validations_binary_access_denied(
         self, storage_service_mock: Mock
     ) -> None:
@@ -75,15 +78,17 @@ class TestBinaryFileValidator(TestCase):
             },
         )
         storage_service_mock.__init__(return_value=storage_service_mock)
-        storage_service_mock.file_exists.side_effect = [
-            True,
-            True,
-            PcpError(
-                Exception(
-                    "An error occurred (403) when calling the HeadObject operation: Forbidden"
+
+        def file_exists(path: str) -> bool:
+            if path == f"{TEST_BINARY_REPO}/{TEST_BINARY_PATHS[2]}":
+                raise PcpError(
+                    Exception(
+                        "An error occurred (403) when calling the HeadObject operation: Forbidden"
+                    )
                 )
-            ),
-        ]
+            return True
+
+        storage_service_mock.file_exists.side_effect = file_exists
         validator = BinaryFileValidator(
             TEST_REGION, TEST_BINARY_REPO, TEST_BINARY_PATHS
         )
@@ -94,7 +99,7 @@ class TestBinaryFileValidator(TestCase):
             storage_service_mock.file_exists.call_count, len(TEST_BINARY_PATHS)
         )
 
-    @patch("fbpcs.pc_pre_validation.binary_file_validator.S3StorageService")
+    @patch("fbpcs.pc_pre_validation.binary_file_validator.get_s3_storage_service")
     def test_run_validations_unexpected_error(self, storage_service_mock: Mock) -> None:
         expected_report = ValidationReport(
             validation_result=ValidationResult.SUCCESS,
@@ -111,4 +116,6 @@ class TestBinaryFileValidator(TestCase):
         report = validator.validate()
 
         self.assertEqual(report, expected_report)
-        self.assertEqual(storage_service_mock.file_exists.call_count, 1)
+        self.assertEqual(
+            storage_service_mock.file_exists.call_count, len(TEST_BINARY_PATHS)
+        )
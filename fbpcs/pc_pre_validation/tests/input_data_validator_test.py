@@ -37,13 +37,15 @@ class TestInputDataValidator(TestCase):
             file.write("")
 
     def tearDown(self) -> None:
-        os.remove(TEST_TEMP_FILEPATH)
+        # the validator deletes its local copy once it is done with it
+        if os.path.exists(TEST_TEMP_FILEPATH):
+            os.remove(TEST_TEMP_FILEPATH)
 
     def write_lines_to_file(self, lines: Iterable[bytes]) -> None:
         with open(TEST_TEMP_FILEPATH, "wb") as tmp_csv_file:
             tmp_csv_file.writelines(lines)
 
-    @patch("fbpcs.pc_pre_validation.input_data_validator.S3StorageService")
+    @patch("fbpcs.pc_pre_validation.input_data_validator.get_s3_storage_service")
     def test_initializing_the_validation_runner_fields(
         self, mock_storage_service: Mock
     ) -> None:
@@ -63,7 +65,7 @@ class TestInputDataValidator(TestCase):
         self.assertEqual(validator._input_file_path, TEST_INPUT_FILE_PATH)
         self.assertEqual(validator._cloud_provider, cloud_provider)
 
-    @patch("fbpcs.pc_pre_validation.input_data_validator.S3StorageService")
+    @patch("fbpcs.pc_pre_validation.input_data_validator.get_s3_storage_service")
     def test_run_validations_copy_failure(self, storage_service_mock: Mock) -> None:
         exception_message = "failed to copy"
         input_file_path = "s3://test-bucket/data.csv"
@@ -84,7 +86,7 @@ class TestInputDataValidator(TestCase):
 
         self.assertEqual(report, expected_report)
 
-    @patch("fbpcs.pc_pre_validation.input_data_validator.S3StorageService")
+    @patch("fbpcs.pc_pre_validation.input_data_validator.get_s3_storage_service")
     @patch("fbpcs.pc_pre_validation.input_data_validator.time")
     def test_run_validations_reads_the_local_csv_rows(
         self, time_mock: Mock, _storage_service_mock: Mock
@@ -113,8 +115,9 @@ class TestInputDataValidator(TestCase):
         report = validator.validate()
 
         self.assertEqual(report, expected_report)
+        self.assertFalse(os.path.exists(TEST_TEMP_FILEPATH))
 
-    @patch("fbpcs.pc_pre_validation.input_data_validator.S3StorageService")
+    @patch("fbpcs.pc_pre_validation.input_data_validator.get_s3_storage_service")
     @patch("fbpcs.pc_pre_validation.input_data_validator.time")
     def test_run_validations_errors_when_input_data_fields_not_found(
         self, time_mock: Mock, _storage_service_mock: Mock
@@ -144,7 +147,7 @@ class TestInputDataValidator(TestCase):
 
         self.assertEqual(report, expected_report)
 
-    @patch("fbpcs.pc_pre_validation.input_data_validator.S3StorageService")
+    @patch("fbpcs.pc_pre_validation.input_data_validator.get_s3_storage_service")
     @patch("fbpcs.pc_pre_validation.input_data_validator.time")
     def test_run_validations_errors_when_there_is_no_header_row(
         self, time_mock: Mock, _storage_service_mock: Mock
@@ -167,7 +170,7 @@ class TestInputDataValidator(TestCase):
 
         self.assertEqual(report, expected_report)
 
-    @patch("fbpcs.pc_pre_validation.input_data_validator.S3StorageService")
+    @patch("fbpcs.pc_pre_validation.input_data_validator.get_s3_storage_service")
     @patch("fbpcs.pc_pre_validation.input_data_validator.time")
     def test_run_validations_errors_when_the_line_ending_is_unsupported(
         self, time_mock: Mock, _storage_service_mock: Mock
@@ -197,7 +200,7 @@ class TestInputDataValidator(TestCase):
 
         self.assertEqual(report, expected_report)
 
-    @patch("fbpcs.pc_pre_validation.input_data_validator.S3StorageService")
+    @patch("fbpcs.pc_pre_validation.input_data_validator.get_s3_storage_service")
     @patch("fbpcs.pc_pre_validation.input_data_validator.time")
     def test_run_validations_reports_for_pl_when_row_values_are_empty(
         self, time_mock: Mock, _storage_service_mock: Mock
@@ -241,7 +244,7 @@ class TestInputDataValidator(TestCase):
 
         self.assertEqual(report, expected_report)
 
-    @patch("fbpcs.pc_pre_validation.input_data_validator.S3StorageService")
+    @patch("fbpcs.pc_pre_validation.input_data_validator.get_s3_storage_service")
     @patch("fbpcs.pc_pre_validation.input_data_validator.time")
     def test_run_validations_reports_for_pa_when_row_values_are_empty(
         self, time_mock: Mock, _storage_service_mock: Mock
@@ -285,7 +288,7 @@ class TestInputDataValidator(TestCase):
 
         self.assertEqual(report, expected_report)
 
-    @patch("fbpcs.pc_pre_validation.input_data_validator.S3StorageService")
+    @patch("fbpcs.pc_pre_validation.input_data_validator.get_s3_storage_service")
     @patch("fbpcs.pc_pre_validation.input_data_validator.time")
     def test_run_validations_reports_for_pl_when_row_values_are_not_valid(
         self, time_mock: Mock, _storage_service_mock: Mock
@@ -329,7 +332,7 @@ class TestInputDataValidator(TestCase):
 
         self.assertEqual(report, expected_report)
 
-    @patch("fbpcs.pc_pre_validation.input_data_validator.S3StorageService")
+    @patch("fbpcs.pc_pre_validation.input_data_validator.get_s3_storage_service")
     @patch("fbpcs.pc_pre_validation.input_data_validator.time")
     def test_run_validations_reports_for_pa_when_row_values_are_not_valid(
         self, time_mock: Mock, _storage_service_mock: Mock
@@ -372,3 +375,65 @@ class TestInputDataValidator(TestCase):
         report = validator.validate()
 
         self.assertEqual(report, expected_report)
+
+    @patch("fbpcs.pc_pre_validation.input_data_validator.get_s3_storage_service")
+    @patch("fbpcs.pc_pre_validation.input_data_validator.time")
+    def test_run_validations_errors_when_a_row_has_the_wrong_number_of_fields(
+        self, time_mock: Mock, _storage_service_mock: Mock
+    ) -> None:
+        exception_message = "Row 2 has 2 fields, but the header row has 3 fields."
+        time_mock.time.return_value = TEST_TIMESTAMP
+        cloud_provider = CloudProvider.AWS
+        lines = [
+            b"id_,value,event_timestamp\n",
+            b"abcd/1234+WXYZ=,100,1645157987\n",
+            b"abcd/1234+WXYZ=,100\n",
+            b"abcd/1234+WXYZ=,100,1645157987\n",
+        ]
+        self.write_lines_to_file(lines)
+        expected_report = ValidationReport(
+            validation_result=ValidationResult.FAILED,
+            validator_name=INPUT_DATA_VALIDATOR_NAME,
+            message=f"File: {TEST_INPUT_FILE_PATH} failed validation. Error: {exception_message}",
+            details={
+                "rows_processed_count": 1,
+            },
+        )
+
+        validator = InputDataValidator(
+            TEST_INPUT_FILE_PATH, cloud_provider, TEST_REGION
+        )
+        report = validator.validate()
+
+        self.assertEqual(report, expected_report)
+
+    @patch("fbpcs.pc_pre_validation.input_data_validator.get_s3_storage_service")
+    @patch("fbpcs.pc_pre_validation.input_data_validator.time")
+    def test_run_validations_errors_when_a_row_spans_multiple_lines(
+        self, time_mock: Mock, _storage_service_mock: Mock
+    ) -> None:
+        exception_message = "Row 2 spans multiple lines."
+        time_mock.time.return_value = TEST_TIMESTAMP
+        cloud_provider = CloudProvider.AWS
+        lines = [
+            b"id_,value,event_timestamp\n",
+            b"abcd/1234+WXYZ=,100,1645157987\n",
+            b'"ab\ncd",100,1645157987\n',
+            b"abcd/1234+WXYZ=,100,1645157987\n",
+        ]
+        self.write_lines_to_file(lines)
+        expected_report = ValidationReport(
+            validation_result=ValidationResult.FAILED,
+            validator_name=INPUT_DATA_VALIDATOR_NAME,
+            message=f"File: {TEST_INPUT_FILE_PATH} failed validation. Error: {exception_message}",
+            details={
+                "rows_processed_count": 1,
+            },
+        )
+
+        validator = InputDataValidator(
+            TEST_INPUT_FILE_PATH, cloud_provider, TEST_REGION
+        )
+        report = validator.validate()
+
+        self.assertEqual(report, expected_report)
@@ -0,0 +1,125 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-strict
+
+import io
+import json
+import shlex
+from typing import List
+from unittest import TestCase
+from unittest.mock import patch, Mock
+
+from fbpcs.pc_pre_validation import pc_pre_validation_cli
+from fbpcs.pc_pre_validation.enums import ValidationResult
+from fbpcs.private_computation.entity.cloud_provider import CloudProvider
+
+TEST_INPUT_FILE_PATH = "s3://test-bucket/data.csv"
+TEST_REGION = "us-west-2"
+TEST_ACCESS_KEY_ID = "id1"
+TEST_ACCESS_KEY_DATA = "data2"
+TEST_THRESHOLD_OVERRIDE: str = json.dumps({"id_": 0.95, "value": 0.8})
+
+
+def get_argv(cloud_provider: str = "AWS", region_flag: str = "--region") -> List[str]:
+    # The OneDocker runner shlex-splits the joined arguments back into argv
+    return shlex.split(
+        shlex.join(
+            [
+                f"--input-file-path={TEST_INPUT_FILE_PATH}",
+                f"--cloud-provider={cloud_provider}",
+                f"{region_flag}={TEST_REGION}",
+                f"--access-key-id={TEST_ACCESS_KEY_ID}",
+                f"--access-key-data={TEST_ACCESS_KEY_DATA}",
+                f"--valid-threshold-override={TEST_THRESHOLD_OVERRIDE}",
+            ]
+        )
+    )
+
+
+@patch("fbpcs.pc_pre_validation.validators_runner.run_validators")
+@patch("fbpcs.pc_pre_validation.binary_file_validator.BinaryFileValidator")
+@patch("fbpcs.pc_pre_validation.input_data_validator.InputDataValidator")
+class TestPCPreValidationCLI(TestCase):
+    def test_parsing_a_quoted_threshold_override(
+        self,
+        _input_data_validator_mock: Mock,
+        _binary_file_validator_mock: Mock,
+        _run_validators_mock: Mock,
+    ) -> None:
+        arguments = pc_pre_validation_cli._PARSER.parse_args(get_argv())
+
+        self.assertEqual(arguments.valid_threshold_override, TEST_THRESHOLD_OVERRIDE)
+
+    def test_main_passes_the_arguments_to_the_validators(
+        self,
+        input_data_validator_mock: Mock,
+        binary_file_validator_mock: Mock,
+        run_validators_mock: Mock,
+    ) -> None:
+        run_validators_mock.return_value = (ValidationResult.SUCCESS, "report")
+
+        with patch("sys.argv", ["pc_pre_validation_cli", *get_argv()]):
+            pc_pre_validation_cli.main()
+
+        input_data_validator_mock.assert_called_with(
+            TEST_INPUT_FILE_PATH,
+            CloudProvider.AWS,
+            TEST_REGION,
+            TEST_ACCESS_KEY_ID,
+            TEST_ACCESS_KEY_DATA,
+        )
+        binary_file_validator_mock.assert_called_with(
+            region=TEST_REGION,
+            access_key_id=TEST_ACCESS_KEY_ID,
+            access_key_data=TEST_ACCESS_KEY_DATA,
+        )
+        run_validators_mock.assert_called_with(
+            [input_data_validator_mock(), binary_file_validator_mock()]
+        )
+
+    def test_main_raises_when_a_validation_fails(
+        self,
+        _input_data_validator_mock: Mock,
+        _binary_file_validator_mock: Mock,
+        run_validators_mock: Mock,
+    ) -> None:
+        run_validators_mock.return_value = (ValidationResult.FAILED, "failed report")
+
+        with patch("sys.argv", ["pc_pre_validation_cli", *get_argv()]):
+            with self.assertRaisesRegex(Exception, "failed report"):
+                pc_pre_validation_cli.main()
+
+    def test_main_exits_with_a_usage_error_for_an_unknown_cloud_provider(
+        self,
+        input_data_validator_mock: Mock,
+        _binary_file_validator_mock: Mock,
+        run_validators_mock: Mock,
+    ) -> None:
+        argv = ["pc_pre_validation_cli", *get_argv(cloud_provider="FOO")]
+
+        with patch("sys.argv", argv), patch("sys.stderr", new_callable=io.StringIO):
+            with self.assertRaises(SystemExit) as context:
+                pc_pre_validation_cli.main()
+
+        self.assertEqual(context.exception.code, 2)
+        input_data_validator_mock.assert_not_called()
+        run_validators_mock.assert_not_called()
+
+    def test_main_rejects_an_abbreviated_flag(
+        self,
+        input_data_validator_mock: Mock,
+        _binary_file_validator_mock: Mock,
+        run_validators_mock: Mock,
+    ) -> None:
+        argv = ["pc_pre_validation_cli", *get_argv(region_flag="--regio")]
+
+        with patch("sys.argv", argv), patch("sys.stderr", new_callable=io.StringIO):
+            with self.assertRaises(SystemExit) as context:
+                pc_pre_validation_cli.main()
+
+        self.assertEqual(context.exception.code, 2)
+        input_data_validator_mock.assert_not_called()
+        run_validators_mock.assert_not_called()
@@ -0,0 +1,41 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+# pyre-strict
+
+from unittest import TestCase
+from unittest.mock import patch, Mock
+
+from fbpcs.pc_pre_validation.storage import get_s3_storage_service
+
+
+class TestStorage(TestCase):
+    def setUp(self) -> None:
+        get_s3_storage_service.cache_clear()
+
+    def tearDown(self) -> None:
+        get_s3_storage_service.cache_clear()
+
+    @patch("fbpcs.pc_pre_validation.storage.S3StorageService")
+    def test_storage_service_is_shared_for_the_same_credentials(
+        self, storage_service_mock: Mock
+    ) -> None:
+        storage_service_1 = get_s3_storage_service("us-west-2", "id1", "data1")
+        storage_service_2 = get_s3_storage_service("us-west-2", "id1", "data1")
+
+        storage_service_mock.assert_called_once_with("us-west-2", "id1", "data1")
+        self.assertIs(storage_service_1, storage_service_2)
+
+    @patch("fbpcs.pc_pre_validation.storage.S3StorageService")
+    def test_storage_service_is_not_shared_for_different_credentials(
+        self, storage_service_mock: Mock
+    ) -> None:
+        storage_service_mock.side_effect = [Mock(), Mock()]
+
+        storage_service_1 = get_s3_storage_service("us-west-2", "id1", "data1")
+        storage_service_2 = get_s3_storage_service("us-west-2", "id2", "data2")
+
+        self.assertEqual(storage_service_mock.call_count, 2)
+        self.assertIsNot(storage_service_1, storage_service_2)
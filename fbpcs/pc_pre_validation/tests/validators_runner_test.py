@@ -5,6 +5,7 @@
 
 # pyre-strict
 
+import threading
 from unittest import TestCase
 
 from fbpcs.pc_pre_validation.enums import ValidationResult
@@ -34,6 +35,19 @@ class TestExceptionValidator(Validator):
         raise Exception("test error message")
 
 
+class TestBarrierValidator(TestDummyValidator):
+    def __init__(
+        self, dummy_report: ValidationReport, barrier: threading.Barrier
+    ) -> None:
+        super().__init__(dummy_report)
+        self.barrier = barrier
+
+    def __validate__(self) -> ValidationReport:
+        # only returns once every validator sharing the barrier is running
+        self.barrier.wait()
+        return self.dummy_report
+
+
 TEST_SUCCESSFUL_REPORT_1 = ValidationReport(
     validation_result=ValidationResult.SUCCESS,
     validator_name="validator 1",
@@ -115,3 +129,26 @@ class TestValidationReport(TestCase):
 
         self.assertEqual(expected_aggregated_result, actual_result)
         self.assertEqual(expected_aggregated_report, actual_report)
+
+    def test_validators_run_concurrently(self) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+        expected_aggregated_result = ValidationResult.FAILED
+        expected_aggregated_report = (
+            f"{TEST_SUCCESSFUL_REPORT_1}\n\n{TEST_FAILED_REPORT_1}"
+        )
+
+        (actual_result, actual_report) = run_validators(
+            [
+                TestBarrierValidator(TEST_SUCCESSFUL_REPORT_1, barrier),
+                TestBarrierValidator(TEST_FAILED_REPORT_1, barrier),
+            ]
+        )
+
+        self.assertEqual(expected_aggregated_result, actual_result)
+        self.assertEqual(expected_aggregated_report, actual_report)
+
+    def test_no_validators(self) -> None:
+        (actual_result, actual_report) = run_validators([])
+
+        self.assertEqual(ValidationResult.SUCCESS, actual_result)
+        self.assertEqual("", actual_report)
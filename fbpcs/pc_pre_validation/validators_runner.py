@@ -6,6 +6,7 @@
 
 # pyre-strict
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple
 
 from fbpcs.pc_pre_validation.enums import ValidationResult
@@ -14,10 +15,15 @@ from fbpcs.pc_pre_validation.validator import Validator
 
 
 def run_validators(validators: List[Validator]) -> Tuple[ValidationResult, str]:
-    # run each validator once
-    validation_reports: List[ValidationReport] = [
-        validator.validate() for validator in validators
-    ]
+    if not validators:
+        return (ValidationResult.SUCCESS, "")
+
+    # run each validator once. The validators are I/O bound and independent of
+    # each other, so they run concurrently; map() keeps the reports in order.
+    with ThreadPoolExecutor(max_workers=len(validators)) as executor:
+        validation_reports: List[ValidationReport] = list(
+            executor.map(lambda validator: validator.validate(), validators)
+        )
 
     # aggregated result is SUCCESS only if all validators succeed.
     validator_results = [
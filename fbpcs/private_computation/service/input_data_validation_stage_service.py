@@ -6,13 +6,27 @@
 
 # pyre-strict
 
+import asyncio
 import json
 import logging
-from typing import List, Optional
+import shlex
+import time
+from typing import List, Optional, Tuple
 
 from fbpcp.service.onedocker import OneDockerService
-from fbpcs.common.entity.stage_state_instance import StageStateInstance
+from fbpcp.service.storage import StorageService
+from fbpcp.service.storage_s3 import S3StorageService
+from fbpcs.common.entity.stage_state_instance import (
+    StageStateInstance,
+    StageStateInstanceStatus,
+)
 from fbpcs.onedocker_binary_names import OneDockerBinaryNames
+from fbpcs.pc_pre_validation.binary_file_validator import BinaryFileValidator
+from fbpcs.pc_pre_validation.enums import ValidationResult
+from fbpcs.pc_pre_validation.input_data_validator import InputDataValidator
+from fbpcs.pc_pre_validation.validator import Validator
+from fbpcs.pc_pre_validation.validators_runner import run_validators
+from fbpcs.private_computation.entity.cloud_provider import CloudProvider
 from fbpcs.private_computation.entity.pc_validator_config import (
     PCValidatorConfig,
 )
@@ -32,6 +46,10 @@ from fbpcs.private_computation.service.utils import (
 
 # 20 minutes
 PRE_VALIDATION_CHECKS_TIMEOUT: int = 1200
+# Input files smaller than this are validated in process instead of in a
+# container, since provisioning the container takes far longer than the
+# validation itself. 10 MiB
+INLINE_VALIDATION_MAX_INPUT_SIZE_BYTES: int = 10 * 1024 * 1024
 
 
 class InputDataValidationStageService(PrivateComputationStageService):
@@ -45,8 +63,19 @@ class InputDataValidationStageService(PrivateComputationStageService):
     It is implemented in a Cloud agnostic way.
     """
 
+    __slots__ = (
+        "_logger",
+        "_failed_status",
+        "_pc_validator_config",
+        "_onedocker_svc",
+        "_storage_svc",
+    )
+
     def __init__(
-        self, pc_validator_config: PCValidatorConfig, onedocker_svc: OneDockerService
+        self,
+        pc_validator_config: PCValidatorConfig,
+        onedocker_svc: OneDockerService,
+        storage_svc: Optional[StorageService] = None,
     ) -> None:
         self._logger: logging.Logger = logging.getLogger(__name__)
         self._failed_status: PrivateComputationInstanceStatus = (
@@ -54,6 +83,8 @@ class InputDataValidationStageService(PrivateComputationStageService):
         )
         self._pc_validator_config: PCValidatorConfig = pc_validator_config
         self._onedocker_svc = onedocker_svc
+        # used to look up the input file size; without it every run uses a container
+        self._storage_svc = storage_svc
 
     async def run_async(
         self,
@@ -65,10 +96,20 @@ class InputDataValidationStageService(PrivateComputationStageService):
         """
         self._logger.info("[PCPreValidation] - Starting stage")
         if self._should_run_pre_validation(pc_instance):
-            self._logger.info(
-                "[PCPreValidation] - starting a pc_pre_validation_cli run"
-            )
-            await self.run_pc_pre_validation_cli(pc_instance)
+            credentials = self._get_s3_credentials()
+            if credentials is not None and await self._is_small_input(pc_instance):
+                self._logger.info(
+                    "[PCPreValidation] - running validations in process for a small input file"
+                )
+                access_key_id, access_key_data = credentials
+                await self.run_validations_in_process(
+                    pc_instance, access_key_id, access_key_data
+                )
+            else:
+                self._logger.info(
+                    "[PCPreValidation] - starting a pc_pre_validation_cli run"
+                )
+                await self.run_pc_pre_validation_cli(pc_instance)
         else:
             self._logger.info("[PCPreValidation] - skipped run validations")
 
@@ -79,19 +120,22 @@ class InputDataValidationStageService(PrivateComputationStageService):
         self, pc_instance: PrivateComputationInstance
     ) -> None:
         region = self._pc_validator_config.region
-        cmd_args = [
+        threshold_overrides = (
+            self._pc_validator_config.data_validation_threshold_overrides
+        )
+        cmd_args = (
             f"--input-file-path={pc_instance.input_path}",
             "--cloud-provider=AWS",
             f"--region={region}",
-        ]
-        threshold_overrides = (
-            self._pc_validator_config.data_validation_threshold_overrides
+            *(
+                (f"--valid-threshold-override={json.dumps(threshold_overrides)}",)
+                if threshold_overrides
+                else ()
+            ),
         )
-        if threshold_overrides:
-            threshold_overrides_str = json.dumps(threshold_overrides)
-            cmd_args.append(f"--valid-threshold-override='{threshold_overrides_str}'")
 
-        cmd_args_str = " ".join(cmd_args)
+        # The OneDocker runner shlex-splits this string back into argv
+        cmd_args_str = shlex.join(cmd_args)
 
         container_instance = self._onedocker_svc.start_container(
             package_name=OneDockerBinaryNames.PC_PRE_VALIDATION.value,
@@ -108,6 +152,59 @@ class InputDataValidationStageService(PrivateComputationStageService):
             f"[PCPreValidation] - Started container instance_id: {container_instance.instance_id} status: {container_instance.status}"
         )
 
+    async def run_validations_in_process(
+        self,
+        pc_instance: PrivateComputationInstance,
+        access_key_id: Optional[str] = None,
+        access_key_data: Optional[str] = None,
+    ) -> None:
+        """
+        Runs the same validators as pc_pre_validation_cli without a container
+        and records the outcome in a StageStateInstance that has no containers
+        """
+        region = self._pc_validator_config.region
+        validators: List[Validator] = [
+            InputDataValidator(
+                pc_instance.input_path,
+                CloudProvider.AWS,
+                region,
+                access_key_id=access_key_id,
+                access_key_data=access_key_data,
+            ),
+            BinaryFileValidator(
+                region=region,
+                access_key_id=access_key_id,
+                access_key_data=access_key_data,
+            ),
+        ]
+        # the validators block on S3, so keep them off the event loop
+        loop = asyncio.get_running_loop()
+        try:
+            (aggregated_result, aggregated_report) = await asyncio.wait_for(
+                loop.run_in_executor(None, run_validators, validators),
+                timeout=PRE_VALIDATION_CHECKS_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            aggregated_result = ValidationResult.FAILED
+            aggregated_report = f"validations did not finish within {PRE_VALIDATION_CHECKS_TIMEOUT} seconds"
+
+        if aggregated_result is ValidationResult.SUCCESS:
+            status = StageStateInstanceStatus.COMPLETED
+            self._logger.info(f"[PCPreValidation] - Success: {aggregated_report}")
+        else:
+            status = StageStateInstanceStatus.FAILED
+            self._logger.error(
+                f"[PCPreValidation] - stage failed because of some failed validations:\n{aggregated_report}"
+            )
+
+        stage_state = StageStateInstance(
+            pc_instance.instance_id,
+            pc_instance.current_stage.name,
+            status=status,
+            end_ts=int(time.time()),
+        )
+        pc_instance.instances.append(stage_state)
+
     def get_status(
         self,
         pc_instance: PrivateComputationInstance,
@@ -117,22 +214,27 @@ class InputDataValidationStageService(PrivateComputationStageService):
         """
         # When this stage is enabled, it should return the status based on the container status
         if self._should_run_pre_validation(pc_instance):
+            last_stage_state = self._get_last_stage_state(pc_instance)
+            if last_stage_state and not last_stage_state.containers:
+                return self._get_in_process_status(last_stage_state)
+
             instance_status = get_pc_status_from_stage_state(
                 pc_instance, self._onedocker_svc
             )
+            if instance_status != self._failed_status:
+                return instance_status
 
+            # The task id is only needed to point at the failed task's logs
             task_id = ""
-            if pc_instance.instances:
-                last_instance = pc_instance.instances[-1]
-                if isinstance(last_instance, StageStateInstance):
-                    last_container = last_instance.containers[-1]
-                    task_id = (
-                        last_container.instance_id.split("/")[-1]
-                        if last_container
-                        else ""
-                    )
-
-            if instance_status == self._failed_status and task_id:
+            if last_stage_state:
+                last_container = last_stage_state.containers[-1]
+                task_id = (
+                    last_container.instance_id.rpartition("/")[2]
+                    if last_container
+                    else ""
+                )
+
+            if task_id:
                 region = self._pc_validator_config.region
                 cluster = self._onedocker_svc.container_svc.get_cluster()
                 failed_task_link = f"https://{region}.console.aws.amazon.com/ecs/home?region={region}#/clusters/{cluster}/tasks/{task_id}/details"
@@ -142,7 +244,7 @@ class InputDataValidationStageService(PrivateComputationStageService):
                     + f"Failed task link: {failed_task_link}"
                 )
                 self._logger.error(error_message)
-            elif instance_status == self._failed_status:
+            else:
                 self._logger.error(
                     "[PCPreValidation] - stage failed because of some failed validations. Please check the logs in ECS"
                 )
@@ -151,10 +253,63 @@ class InputDataValidationStageService(PrivateComputationStageService):
 
         return PrivateComputationInstanceStatus.INPUT_DATA_VALIDATION_COMPLETED
 
+    def _get_s3_credentials(
+        self,
+    ) -> Optional[Tuple[Optional[str], Optional[str]]]:
+        """
+        Returns the keys self._storage_svc was configured with, or None when the
+        validators could not be built with the same credentials
+        """
+        if not isinstance(self._storage_svc, S3StorageService):
+            return None
+        config = self._storage_svc.s3_gateway.config
+        # the validators take no session token, so temporary credentials
+        # are left to the container
+        if "aws_session_token" in config:
+            return None
+        return (
+            config.get("aws_access_key_id"),
+            config.get("aws_secret_access_key"),
+        )
+
+    async def _is_small_input(self, pc_instance: PrivateComputationInstance) -> bool:
+        if self._storage_svc is None:
+            return False
+        try:
+            loop = asyncio.get_running_loop()
+            input_size = await loop.run_in_executor(
+                None, self._storage_svc.get_file_size, pc_instance.input_path
+            )
+            return input_size < INLINE_VALIDATION_MAX_INPUT_SIZE_BYTES
+        except Exception as e:
+            self._logger.warning(
+                f"[PCPreValidation] - failed to get the input file size, falling back to a pc_pre_validation_cli run: {e}"
+            )
+            return False
+
+    def _get_last_stage_state(
+        self, pc_instance: PrivateComputationInstance
+    ) -> Optional[StageStateInstance]:
+        if not pc_instance.instances:
+            return None
+        last_instance = pc_instance.instances[-1]
+        return last_instance if isinstance(last_instance, StageStateInstance) else None
+
+    def _get_in_process_status(
+        self, stage_state: StageStateInstance
+    ) -> PrivateComputationInstanceStatus:
+        """
+        Returns the status recorded by run_validations_in_process, which leaves
+        the stage state without containers
+        """
+        if stage_state.status is StageStateInstanceStatus.COMPLETED:
+            return PrivateComputationInstanceStatus.INPUT_DATA_VALIDATION_COMPLETED
+        return self._failed_status
+
     def _should_run_pre_validation(
         self, pc_instance: PrivateComputationInstance
     ) -> bool:
         return (
             self._pc_validator_config.pc_pre_validator_enabled
-            and pc_instance.role == PrivateComputationRole.PARTNER
+            and pc_instance.role is PrivateComputationRole.PARTNER
         )
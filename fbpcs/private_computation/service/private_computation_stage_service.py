@@ -49,6 +49,9 @@ class PrivateComputationStageService(abc.ABC):
     Any parameters necessary to run the stage that aren't provided by run_async should be passed to the subclass' constructor.
     """
 
+    # Lets subclasses that declare __slots__ drop the per-instance __dict__
+    __slots__ = ()
+
     @abc.abstractmethod
     async def run_async(
         self,
@@ -132,7 +132,7 @@ class PrivateComputationPCF2StageFlow(PrivateComputationBaseStageFlow):
             return DummyStageService()
         elif self is self.INPUT_DATA_VALIDATION:
             return InputDataValidationStageService(
-                args.pc_validator_config, args.onedocker_svc
+                args.pc_validator_config, args.onedocker_svc, args.storage_svc
             )
         elif self is self.ID_MATCH:
             return IdMatchStageService(
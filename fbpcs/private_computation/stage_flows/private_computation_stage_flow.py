@@ -133,7 +133,7 @@ class PrivateComputationStageFlow(PrivateComputationBaseStageFlow):
             return DummyStageService()
         elif self is self.INPUT_DATA_VALIDATION:
             return InputDataValidationStageService(
-                args.pc_validator_config, args.onedocker_svc
+                args.pc_validator_config, args.onedocker_svc, args.storage_svc
             )
         elif self is self.PID_SHARD:
             return PIDStageService(
@@ -5,12 +5,20 @@
 # LICENSE file in the root directory of this source tree.
 
 import json
+import shlex
+import threading
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import patch, MagicMock
 
 from fbpcp.entity.container_instance import ContainerInstance
-from fbpcs.common.entity.stage_state_instance import StageStateInstance
+from fbpcp.service.storage_s3 import S3StorageService
+from fbpcs.common.entity.stage_state_instance import (
+    StageStateInstance,
+    StageStateInstanceStatus,
+)
 from fbpcs.onedocker_binary_names import OneDockerBinaryNames
+from fbpcs.pc_pre_validation.enums import ValidationResult
+from fbpcs.private_computation.entity.cloud_provider import CloudProvider
 from fbpcs.private_computation.entity.pc_validator_config import (
     PCValidatorConfig,
 )
@@ -43,6 +51,19 @@ class TestInputDataValidationStageService(IsolatedAsyncioTestCase):
             output_dir="789",
         )
 
+    def _get_s3_storage_svc_mock(self, config=None) -> MagicMock:
+        mock_storage_svc = MagicMock(spec=S3StorageService)
+        mock_storage_svc.s3_gateway = MagicMock()
+        mock_storage_svc.s3_gateway.config = (
+            {
+                "aws_access_key_id": "key-id",
+                "aws_secret_access_key": "key-data",
+            }
+            if config is None
+            else config
+        )
+        return mock_storage_svc
+
     @patch(
         "fbpcs.private_computation.service.input_data_validation_stage_service.StageStateInstance"
     )
@@ -64,7 +85,7 @@ class TestInputDataValidationStageService(IsolatedAsyncioTestCase):
                 f"--input-file-path={self._pc_instance.input_path}",
                 "--cloud-provider=AWS",
                 f"--region={region}",
-                f"--valid-threshold-override='{threshold_overrides_str}'",
+                shlex.quote(f"--valid-threshold-override={threshold_overrides_str}"),
             ]
         )
         pc_validator_config = PCValidatorConfig(
@@ -90,6 +111,34 @@ class TestInputDataValidationStageService(IsolatedAsyncioTestCase):
         )
         self.assertEqual(pc_instance.instances, [mock_stage_state_instance()])
 
+    async def test_run_async_omits_the_threshold_override_when_there_is_none(
+        self,
+    ) -> None:
+        mock_onedocker_svc = MagicMock()
+        region = "us-west-1"
+        expected_cmd_args = " ".join(
+            [
+                f"--input-file-path={self._pc_instance.input_path}",
+                "--cloud-provider=AWS",
+                f"--region={region}",
+            ]
+        )
+        pc_validator_config = PCValidatorConfig(
+            region=region,
+            pc_pre_validator_enabled=True,
+        )
+        stage_service = InputDataValidationStageService(
+            pc_validator_config, mock_onedocker_svc
+        )
+
+        await stage_service.run_async(self._pc_instance)
+
+        mock_onedocker_svc.start_container.assert_called_with(
+            package_name=OneDockerBinaryNames.PC_PRE_VALIDATION.value,
+            timeout=1200,
+            cmd_args=expected_cmd_args,
+        )
+
     @patch(
         "fbpcs.private_computation.service.input_data_validation_stage_service.get_pc_status_from_stage_state"
     )
@@ -231,3 +280,226 @@ class TestInputDataValidationStageService(IsolatedAsyncioTestCase):
             f"[PCPreValidation] - stage failed because of some failed validations. Please check the logs in ECS for task id '{task_id}' to see the validation issues:\n"
             + f"Failed task link: {failed_task_link}"
         )
+
+    @patch(
+        "fbpcs.private_computation.service.input_data_validation_stage_service.get_pc_status_from_stage_state"
+    )
+    @patch(
+        "fbpcs.private_computation.service.input_data_validation_stage_service.run_validators"
+    )
+    @patch(
+        "fbpcs.private_computation.service.input_data_validation_stage_service.BinaryFileValidator"
+    )
+    @patch(
+        "fbpcs.private_computation.service.input_data_validation_stage_service.InputDataValidator"
+    )
+    async def test_run_async_validates_small_inputs_in_process(
+        self,
+        mock_input_data_validator,
+        mock_binary_file_validator,
+        mock_run_validators,
+        mock_get_pc_status_from_stage_state,
+    ) -> None:
+        pc_instance = self._pc_instance
+        region = "us-west-1"
+        mock_onedocker_svc = MagicMock()
+        mock_storage_svc = self._get_s3_storage_svc_mock()
+        mock_storage_svc.get_file_size.return_value = 1024
+        mock_run_validators.return_value = (ValidationResult.SUCCESS, "report")
+        pc_validator_config = PCValidatorConfig(
+            region=region,
+            pc_pre_validator_enabled=True,
+        )
+        stage_service = InputDataValidationStageService(
+            pc_validator_config, mock_onedocker_svc, mock_storage_svc
+        )
+
+        await stage_service.run_async(pc_instance)
+        status = stage_service.get_status(pc_instance)
+
+        mock_storage_svc.get_file_size.assert_called_with(pc_instance.input_path)
+        mock_onedocker_svc.start_container.assert_not_called()
+        mock_get_pc_status_from_stage_state.assert_not_called()
+        mock_input_data_validator.assert_called_with(
+            pc_instance.input_path,
+            CloudProvider.AWS,
+            region,
+            access_key_id="key-id",
+            access_key_data="key-data",
+        )
+        mock_binary_file_validator.assert_called_with(
+            region=region,
+            access_key_id="key-id",
+            access_key_data="key-data",
+        )
+        mock_run_validators.assert_called_with(
+            [mock_input_data_validator(), mock_binary_file_validator()]
+        )
+        self.assertEqual(len(pc_instance.instances), 1)
+        self.assertEqual(
+            pc_instance.instances[0].status, StageStateInstanceStatus.COMPLETED
+        )
+        self.assertEqual(pc_instance.instances[0].containers, [])
+        self.assertEqual(
+            status, PrivateComputationInstanceStatus.INPUT_DATA_VALIDATION_COMPLETED
+        )
+
+    @patch(
+        "fbpcs.private_computation.service.input_data_validation_stage_service.run_validators"
+    )
+    @patch(
+        "fbpcs.private_computation.service.input_data_validation_stage_service.BinaryFileValidator"
+    )
+    @patch(
+        "fbpcs.private_computation.service.input_data_validation_stage_service.InputDataValidator"
+    )
+    async def test_get_status_fails_when_the_in_process_validation_fails(
+        self,
+        _mock_input_data_validator,
+        _mock_binary_file_validator,
+        mock_run_validators,
+    ) -> None:
+        pc_instance = self._pc_instance
+        mock_storage_svc = self._get_s3_storage_svc_mock()
+        mock_storage_svc.get_file_size.return_value = 1024
+        mock_run_validators.return_value = (ValidationResult.FAILED, "report")
+        pc_validator_config = PCValidatorConfig(
+            region="us-west-1",
+            pc_pre_validator_enabled=True,
+        )
+        stage_service = InputDataValidationStageService(
+            pc_validator_config, MagicMock(), mock_storage_svc
+        )
+
+        await stage_service.run_async(pc_instance)
+        status = stage_service.get_status(pc_instance)
+
+        self.assertEqual(
+            pc_instance.instances[0].status, StageStateInstanceStatus.FAILED
+        )
+        self.assertEqual(
+            status, PrivateComputationInstanceStatus.INPUT_DATA_VALIDATION_FAILED
+        )
+
+    @patch(
+        "fbpcs.private_computation.service.input_data_validation_stage_service.run_validators"
+    )
+    async def test_run_async_starts_a_container_for_large_inputs(
+        self, mock_run_validators
+    ) -> None:
+        mock_onedocker_svc = MagicMock()
+        mock_storage_svc = self._get_s3_storage_svc_mock()
+        mock_storage_svc.get_file_size.return_value = 100 * 1024 * 1024
+        pc_validator_config = PCValidatorConfig(
+            region="us-west-1",
+            pc_pre_validator_enabled=True,
+        )
+        stage_service = InputDataValidationStageService(
+            pc_validator_config, mock_onedocker_svc, mock_storage_svc
+        )
+
+        await stage_service.run_async(self._pc_instance)
+
+        mock_onedocker_svc.start_container.assert_called_once()
+        mock_run_validators.assert_not_called()
+
+    @patch(
+        "fbpcs.private_computation.service.input_data_validation_stage_service.run_validators"
+    )
+    async def test_run_async_starts_a_container_when_the_input_size_is_unknown(
+        self, mock_run_validators
+    ) -> None:
+        mock_onedocker_svc = MagicMock()
+        mock_storage_svc = self._get_s3_storage_svc_mock()
+        mock_storage_svc.get_file_size.side_effect = RuntimeError("Forbidden")
+        pc_validator_config = PCValidatorConfig(
+            region="us-west-1",
+            pc_pre_validator_enabled=True,
+        )
+        stage_service = InputDataValidationStageService(
+            pc_validator_config, mock_onedocker_svc, mock_storage_svc
+        )
+
+        await stage_service.run_async(self._pc_instance)
+
+        mock_onedocker_svc.start_container.assert_called_once()
+        mock_run_validators.assert_not_called()
+
+    @patch(
+        "fbpcs.private_computation.service.input_data_validation_stage_service.run_validators"
+    )
+    async def test_run_async_starts_a_container_when_the_credentials_are_temporary(
+        self, mock_run_validators
+    ) -> None:
+        mock_onedocker_svc = MagicMock()
+        mock_storage_svc = self._get_s3_storage_svc_mock(
+            {
+                "aws_access_key_id": "key-id",
+                "aws_secret_access_key": "key-data",
+                "aws_session_token": "token",
+            }
+        )
+        mock_storage_svc.get_file_size.return_value = 1024
+        pc_validator_config = PCValidatorConfig(
+            region="us-west-1",
+            pc_pre_validator_enabled=True,
+        )
+        stage_service = InputDataValidationStageService(
+            pc_validator_config, mock_onedocker_svc, mock_storage_svc
+        )
+
+        await stage_service.run_async(self._pc_instance)
+
+        mock_onedocker_svc.start_container.assert_called_once()
+        mock_run_validators.assert_not_called()
+
+    @patch(
+        "fbpcs.private_computation.service.input_data_validation_stage_service.PRE_VALIDATION_CHECKS_TIMEOUT",
+        0.1,
+    )
+    @patch(
+        "fbpcs.private_computation.service.input_data_validation_stage_service.run_validators"
+    )
+    @patch(
+        "fbpcs.private_computation.service.input_data_validation_stage_service.BinaryFileValidator"
+    )
+    @patch(
+        "fbpcs.private_computation.service.input_data_validation_stage_service.InputDataValidator"
+    )
+    async def test_get_status_fails_when_the_in_process_validation_times_out(
+        self,
+        _mock_input_data_validator,
+        _mock_binary_file_validator,
+        mock_run_validators,
+    ) -> None:
+        pc_instance = self._pc_instance
+        mock_storage_svc = self._get_s3_storage_svc_mock()
+        mock_storage_svc.get_file_size.return_value = 1024
+        release_validators = threading.Event()
+
+        def _block(_validators):
+            # outlasts the patched timeout; released once the stage has failed
+            release_validators.wait(5)
+            return (ValidationResult.SUCCESS, "report")
+
+        mock_run_validators.side_effect = _block
+        pc_validator_config = PCValidatorConfig(
+            region="us-west-1",
+            pc_pre_validator_enabled=True,
+        )
+        stage_service = InputDataValidationStageService(
+            pc_validator_config, MagicMock(), mock_storage_svc
+        )
+
+        try:
+            await stage_service.run_async(pc_instance)
+        finally:
+            release_validators.set()
+        status = stage_service.get_status(pc_instance)
+
+        self.assertEqual(
+            pc_instance.instances[0].status, StageStateInstanceStatus.FAILED
+        )
+        self.assertEqual(
+            status, PrivateComputationInstanceStatus.INPUT_DATA_VALIDATION_FAILED
+        )